@@ -0,0 +1,116 @@
+"""Demo methane model shared by the Streamlit app."""
+
+import functools
+
+import numpy as np
+
+# --- Simple constants for demo (ft³ CH4 per cow per day) ---
+# Bakersfield value is based on EPA digester data you extracted.
+# Pullman & Lynden are scaled down to represent colder / milder climates.
+# Stored as parallel arrays indexed through LOCATION_INDEX.
+# Climates: Pullman cold (NW), Lynden mild (coastal WA), Bakersfield warm (CA EPA data).
+LOCATION_NAMES = ("Pullman", "Lynden", "Bakersfield")
+LOCATION_FT3_PER_COW = np.array([25, 30, 37], dtype=np.float64)
+LOCATION_INDEX = {name: i for i, name in enumerate(LOCATION_NAMES)}
+
+# Climate multipliers for the line chart (relative to "Mild")
+CLIMATE_MULTIPLIER = {
+    "Cold": 0.7,
+    "Mild": 1.0,
+    "Warm": 1.3,
+}
+_CLIMATE_KEYS = tuple(CLIMATE_MULTIPLIER)
+_CLIMATE_MULTS = np.array(tuple(CLIMATE_MULTIPLIER.values()), dtype=np.float64)
+
+# Days per selected time unit
+MODE_FACTOR = {
+    "day": 1,
+    "month": 30,
+    "year": 365,
+}
+
+# ft³ CH4 per cow for every (location, mode), precomputed at import time
+PREDICT_TABLE = {
+    (location, mode): float(LOCATION_FT3_PER_COW[i] * factor)
+    for location, i in LOCATION_INDEX.items()
+    for mode, factor in MODE_FACTOR.items()
+}
+# Same, pre-multiplied for each climate in CLIMATE_MULTIPLIER order
+CLIMATE_TABLE = {
+    key: _CLIMATE_MULTS * per_cow for key, per_cow in PREDICT_TABLE.items()
+}
+
+# Rough conversion factors (demo only)
+ELECTRICITY_PER_FT3 = 0.1      # kWh per ft³ CH4 (very approximate)
+CO2EQ_PER_FT3_KG = 0.52        # kg CO2-eq per ft³ CH4 (approx)
+CAR_CO2_PER_YEAR_KG = 4600     # one passenger car per year (EPA-style)
+
+def predict_methane_ft3(cows: int, location: str, mode: str) -> float:
+    """Very simple demo model: ft³ CH4 per selected time unit."""
+    return PREDICT_TABLE[(location, mode)] * cows
+
+def climate_scenarios(cows: int, base_location: str, mode: str):
+    """Return methane for the same farm under Cold/Mild/Warm climates."""
+    return dict(zip(_CLIMATE_KEYS, (CLIMATE_TABLE[(base_location, mode)] * cows).tolist()))
+
+@functools.lru_cache(maxsize=128)
+def format_output(cows: int, location: str, mode: str) -> tuple[str, str, str]:
+    """Formatted metric label, metric value and equivalents line for one prediction."""
+    methane_ft3 = predict_methane_ft3(cows, location, mode)
+
+    # Electricity and cars equivalent
+    kwh = methane_ft3 * ELECTRICITY_PER_FT3
+    co2eq_kg = methane_ft3 * CO2EQ_PER_FT3_KG
+
+    if mode == "year":
+        car_equiv = co2eq_kg / CAR_CO2_PER_YEAR_KG
+    else:
+        # Convert to annual car equivalents just for intuition
+        car_equiv = (co2eq_kg * (365 if mode == "day" else 12)) / CAR_CO2_PER_YEAR_KG
+
+    return (
+        f"Methane emission ({mode})",
+        f"{methane_ft3:,.0f} ft³",
+        f"**Energy equivalent:** ~{kwh:,.0f} kWh "
+        f" &nbsp; | &nbsp; **Climate impact:** ~{car_equiv:,.1f} car-equivalents",
+    )
+
+def _predict_methane_ft3_batch_loop(cows, base_ft3, mode_factor, climate_mults):
+    result = np.empty((cows.shape[0], climate_mults.shape[0]), dtype=np.float64)
+    per_cow = base_ft3 * mode_factor
+    for i in range(cows.shape[0]):
+        for j in range(climate_mults.shape[0]):
+            result[i, j] = per_cow * cows[i] * climate_mults[j]
+    return result
+
+def _predict_methane_ft3_batch_numpy(cows, base_ft3, mode_factor, climate_mults):
+    return (base_ft3 * mode_factor) * np.outer(cows, climate_mults)
+
+@functools.lru_cache(maxsize=None)
+def _get_batch_kernel():
+    """numba-compiled batch kernel if numba is available, else the NumPy version.
+
+    numba is imported here rather than at module load so it stays off the
+    app's cold-start path.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to plain NumPy
+        return _predict_methane_ft3_batch_numpy
+
+    return njit(cache=True)(_predict_methane_ft3_batch_loop)
+
+def predict_methane_ft3_batch(
+    cows: np.ndarray, base_ft3: float, mode_factor: int, climate_mults: np.ndarray = _CLIMATE_MULTS
+) -> np.ndarray:
+    """Methane for many herd sizes at once: one row per herd size, one column per climate.
+
+    ``cows`` and ``climate_mults`` are flattened to 1-D first, so both kernels
+    accept the same inputs.
+    """
+    return _get_batch_kernel()(
+        np.ascontiguousarray(cows, dtype=np.float64).reshape(-1),
+        float(base_ft3),
+        mode_factor,
+        np.ascontiguousarray(climate_mults, dtype=np.float64).reshape(-1),
+    )
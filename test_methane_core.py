@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from methane_core import (
+    LOCATION_FT3_PER_COW,
+    LOCATION_INDEX,
+    MODE_FACTOR,
+    _CLIMATE_MULTS,
+    _predict_methane_ft3_batch_loop,
+    _predict_methane_ft3_batch_numpy,
+    predict_methane_ft3,
+    predict_methane_ft3_batch,
+)
+
+COWS = np.arange(100, 20001, 100)
+
+
+@pytest.mark.parametrize("location", list(LOCATION_INDEX))
+@pytest.mark.parametrize("mode", list(MODE_FACTOR))
+def test_batch_matches_scalar_model(location, mode):
+    base = LOCATION_FT3_PER_COW[LOCATION_INDEX[location]]
+    batch = predict_methane_ft3_batch(COWS, base, MODE_FACTOR[mode])
+
+    # Column 1 is the "Mild" climate, i.e. the unscaled scalar prediction
+    expected = [predict_methane_ft3(int(c), location, mode) for c in COWS]
+    np.testing.assert_allclose(batch[:, 1], expected)
+
+
+def test_batch_flattens_cows():
+    flat = predict_methane_ft3_batch(np.array([1, 2]), 25, 1)
+    nested = predict_methane_ft3_batch(np.array([[1, 2]]), 25, 1)
+    np.testing.assert_array_equal(nested, flat)
+    assert flat.shape == (2, 3)
+
+
+def test_numba_kernel_matches_numpy():
+    numba = pytest.importorskip("numba")
+    kernel = numba.njit(cache=True)(_predict_methane_ft3_batch_loop)
+    cows = COWS.astype(np.float64)
+    np.testing.assert_allclose(
+        kernel(cows, 37.0, 365, _CLIMATE_MULTS),
+        _predict_methane_ft3_batch_numpy(cows, 37.0, 365, _CLIMATE_MULTS),
+    )